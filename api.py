@@ -1,19 +1,55 @@
 #!/usr/bin/env python3
-from fastapi import FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, Field
-from typing import Optional, Dict
-import requests
-import time
+from typing import Any, Awaitable, Callable, Optional, Dict, Mapping
+from types import MappingProxyType
+import orjson
+import asyncio
+import logging
+import logging.handlers
 import os
+import queue
+import re
+import threading
+import string
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import Json, RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
 from contextlib import contextmanager
+from functools import lru_cache
+from uuid import uuid4
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
+from coolify_client import CoolifyClient
+
 # Load environment variables
 load_dotenv()
 
+# === LOGGING ===
+
+# Handlers only enqueue records; a background QueueListener thread does the
+# actual stream writes, so request handlers never block on stdout/stderr
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+
+logger = logging.getLogger("coolify_api")
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+logger.propagate = False
+
+# An unrecognised LOG_LEVEL falls back to INFO rather than failing at import
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").strip().upper()
+if LOG_LEVEL in logging.getLevelNamesMapping():
+    logger.setLevel(LOG_LEVEL)
+else:
+    logger.setLevel(logging.INFO)
+    logger.warning("⚠️  Unknown LOG_LEVEL %r, using INFO", LOG_LEVEL)
+
 # === CONFIG ===
 COOLIFY_URL = os.getenv("COOLIFY_URL")
 API_TOKEN = os.getenv("API_TOKEN")
@@ -21,16 +57,48 @@ DEPLOY_SERVER_UUID = os.getenv("DEPLOY_SERVER_UUID")
 DOCKERHUB_IMAGE = os.getenv("DOCKERHUB_IMAGE")
 DATABASE_URL = os.getenv("DATABASE_URL")  # Railway provides this
 
-HEADERS = {
-    "Authorization": f"Bearer {API_TOKEN}",
-    "Accept": "application/json",
-    "Content-Type": "application/json"
-}
+# Shared Coolify client; its pooled HTTP/2 connection is opened on startup
+coolify = CoolifyClient(COOLIFY_URL, API_TOKEN)
+
+# Postgres connection pool, created together with the tables on first use
+DB_POOL_MIN_CONN = 1
+DB_POOL_MAX_CONN = 10
+DB_POOL: Optional[ThreadedConnectionPool] = None
+# Reentrant because table setup itself goes through get_db_connection
+_db_init_lock = threading.RLock()
+_db_ready = threading.Event()
+# ThreadedConnectionPool raises instead of blocking when exhausted, so
+# callers wait on this semaphore for a free connection first
+_db_pool_slots = threading.BoundedSemaphore(DB_POOL_MAX_CONN)
 
 # Port counter configuration
 CONTAINER_PORT = 3000  # Fixed container port
+CONTAINER_PORT_STR = str(CONTAINER_PORT)  # As sent in Coolify's ports_exposes
 INITIAL_HOST_PORT = 3003  # Starting port for auto-increment
 
+# Flags shared by every env var we inject
+ENV_PAYLOAD_BASE = {"is_preview": False, "is_literal": True}
+
+# project_uuid -> first environment. A project's default environment rarely
+# changes, so repeat lookups are served from memory for up to a minute.
+# Only touched from the event loop thread, so no lock is needed.
+_ENVIRONMENT_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
+DEPLOYMENT_STATUS_MESSAGES = {
+    "finished": "Deployment completed successfully",
+    "failed": "Deployment failed",
+    "in_progress": "Deployment in progress",
+    "queued": "Deployment queued"
+}
+
+# https://github.com/<owner>/<repo>[.git]; group 1 is set when .git is present.
+# Used with fullmatch so trailing newlines, queries and fragments are rejected.
+_GITHUB_URL_RE = re.compile(r"https?://github\.com/[\w.-]+/(?!\.git$)[\w.-]+?(\.git)?", re.ASCII)
+
+# Allowed subdomain characters. bytes.translate(None, allowed) deletes every
+# allowed byte in one C-level pass, so any leftover byte is invalid.
+_SUBDOMAIN_CHARS = (string.ascii_lowercase + string.digits + "-").encode("ascii")
+
 # === PYDANTIC MODELS ===
 
 class ProjectCreateRequest(BaseModel):
@@ -53,6 +121,22 @@ class ApplicationCreateRequest(BaseModel):
     domain: Optional[str] = Field(None, description="User's chosen subdomain (e.g., 'myapp' for myapp.aedify.ai)")
     build_pack: str = "nixpacks"
 
+class CoolifyApplicationPayload(BaseModel):
+    """Body for Coolify's POST /api/v1/applications/public; constant fields default to the deploy config"""
+    project_uuid: str
+    server_uuid: Optional[str] = DEPLOY_SERVER_UUID
+    environment_name: str
+    destination_uuid: Optional[str] = DEPLOY_SERVER_UUID
+    git_repository: str
+    git_branch: str
+    build_pack: str = "nixpacks"
+    name: str
+    ports_exposes: str
+    ports_mappings: str
+    docker_registry_image_name: Optional[str] = DOCKERHUB_IMAGE
+    instant_deploy: bool = False
+    base_directory: Optional[str] = None
+
 class ApplicationCreateResponse(BaseModel):
     uuid: str
     name: str
@@ -98,12 +182,26 @@ class FullDeploymentResponse(BaseModel):
     url: str = Field(..., description="Full HTTPS URL for the application")
     message: str = "Full deployment completed"
 
+class DeploymentJobResponse(BaseModel):
+    job_id: str
+    status: str = Field(..., description="Job status: pending, running, succeeded or failed")
+    fqdn: str = Field(..., description="Fully qualified domain name")
+    url: str = Field(..., description="Full HTTPS URL for the application")
+    message: str = "Deployment accepted"
+
+class DeploymentJobStatusResponse(BaseModel):
+    job_id: str
+    status: str = Field(..., description="Job status: pending, running, succeeded or failed")
+    result: Optional[FullDeploymentResponse] = Field(None, description="Deployment details once the job succeeded")
+    error: Optional[Any] = Field(None, description="Error detail if the job failed")
+
 # === FASTAPI APP ===
 
 app = FastAPI(
     title="Coolify Deployment API",
     description="API for deploying applications to Coolify",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -115,63 +213,172 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Startup event to initialize database
+# Startup event to initialize shared clients. The database is set up lazily
+# on first use so a slow or briefly unavailable Postgres doesn't hold up boot.
 @app.on_event("startup")
 def startup_event():
-    """Initialize database tables on startup"""
-    print("🚀 Starting Coolify Deployment API...")
-    if DATABASE_URL:
-        print("📊 Initializing PostgreSQL port counter...")
-        initialize_port_counter()
-    else:
-        print("⚠️  WARNING: DATABASE_URL not set. Port counter will not work!")
-        print("   Set DATABASE_URL environment variable to use PostgreSQL.")
+    """Start logging and initialize the Coolify HTTP client on startup"""
+    _log_listener.start()
+    logger.info("🚀 Starting Coolify Deployment API...")
+    coolify.open()
+    if not DATABASE_URL:
+        logger.warning("⚠️  DATABASE_URL not set. Port counter will not work!")
+        logger.warning("   Set DATABASE_URL environment variable to use PostgreSQL.")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled Coolify and database connections and flush logs on shutdown"""
+    await coolify.aclose()
+    if DB_POOL:
+        DB_POOL.closeall()
+    _log_listener.stop()
 
 # === HELPER FUNCTIONS ===
 
-def coolify_post(endpoint: str, payload: dict):
-    """Make POST request to Coolify API"""
-    try:
-        url = f"{COOLIFY_URL}{endpoint}"
-        r = requests.post(url, headers=HEADERS, json=payload)
-        r.raise_for_status()
-        return r.json()
-    except requests.HTTPError as e:
-        error_detail = {"status_code": e.response.status_code}
+async def get_project_environment(project_uuid: str, project: Optional[dict] = None) -> Dict[str, str]:
+    """
+    Get the first (default) environment of a project.
+
+    Checks the in-process cache, then any environments embedded in
+    `project` (e.g. a create-project response), and only falls back to
+    GET /api/v1/projects/{uuid} if neither has it.
+
+    Args:
+        project_uuid: The Coolify project UUID
+        project: Project payload already fetched from Coolify, if any
+
+    Returns:
+        Dict with the environment's 'uuid' and 'name'
+
+    Raises:
+        HTTPException: If the project has no environments
+    """
+    env = _ENVIRONMENT_CACHE.get(project_uuid)
+    if env is not None:
+        return env
+
+    environments = (project or {}).get("environments")
+    if not environments:
+        proj_info = await coolify.get_project(project_uuid)
+        environments = proj_info.get("environments")
+    if not environments:
+        raise HTTPException(status_code=404, detail="No environments found for project")
+
+    env = {"uuid": environments[0]["uuid"], "name": environments[0]["name"]}
+    _ENVIRONMENT_CACHE[project_uuid] = env
+    return env
+
+async def wait_until_ready(
+    fetch: Callable[[], Awaitable[Any]],
+    timeout: float = 5.0,
+    ready: Callable[[Any], bool] = bool
+):
+    """
+    Poll a Coolify read until its response satisfies `ready`.
+
+    Backs off exponentially between attempts (0.1s doubling up to 1s) and
+    returns as soon as the resource is observable, or once timeout expires.
+
+    Args:
+        fetch: Zero-argument coroutine function making the Coolify call
+        timeout: Maximum number of seconds to wait
+        ready: Predicate on the response body (default: non-empty)
+
+    Returns:
+        The last successful response body, or None if every attempt failed
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.1
+    result = None
+
+    while True:
         try:
-            error_detail["detail"] = e.response.json()
-        except:
-            error_detail["detail"] = e.response.text
-        raise HTTPException(status_code=e.response.status_code, detail=error_detail)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+            result = await fetch()
+            if ready(result):
+                return result
+        except HTTPException:
+            pass
+
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return result
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, 1.0)
+
+async def wait_for_app(app_uuid: str, timeout: float = 10.0):
+    """
+    Wait until Coolify serves the application record for app_uuid.
+
+    The app's 'status' field tracks its container (a fresh app reports
+    'exited'), so readiness is the record itself being retrievable.
+    """
+    await wait_until_ready(
+        lambda: coolify.get_application(app_uuid),
+        timeout=timeout,
+        ready=lambda app: isinstance(app, dict) and app.get("uuid") == app_uuid
+    )
+
+async def set_env_vars(app_uuid: str, env_vars: Mapping[str, str], label: str = "Env var"):
+    """
+    Set environment variables on an application.
+
+    All variables are sent in a single PATCH to Coolify's bulk envs endpoint.
+    If that fails (e.g. the Coolify version has no bulk endpoint, or one
+    variable is rejected), each variable is POSTed individually and
+    concurrently instead. Failures are logged and skipped so one bad variable
+    doesn't abort the rest.
+
+    Args:
+        app_uuid: The Coolify application UUID
+        env_vars: Environment variables as key-value pairs
+        label: Prefix used in log messages (e.g., 'System env var')
+    """
+    if not env_vars:
+        return
+
+    envs = [{"key": key, "value": value, **ENV_PAYLOAD_BASE} for key, value in env_vars.items()]
 
-def coolify_get(endpoint: str):
-    """Make GET request to Coolify API"""
     try:
-        url = f"{COOLIFY_URL}{endpoint}"
-        r = requests.get(url, headers=HEADERS)
-        r.raise_for_status()
-        return r.json()
-    except requests.HTTPError as e:
-        error_detail = {"status_code": e.response.status_code}
-        try:
-            error_detail["detail"] = e.response.json()
-        except:
-            error_detail["detail"] = e.response.text
-        raise HTTPException(status_code=e.response.status_code, detail=error_detail)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        await coolify.set_envs_bulk(app_uuid, envs)
+        logger.info("✅ %ss set: %s", label, ", ".join(env_vars))
+        return
+    except HTTPException as e:
+        logger.warning("⚠️  Bulk env update failed (%s), setting %ss individually", e.status_code, label.lower())
+
+    results = await asyncio.gather(
+        *(coolify.set_env(app_uuid, env) for env in envs),
+        return_exceptions=True
+    )
+
+    for key, result in zip(env_vars, results):
+        if isinstance(result, Exception):
+            logger.warning("⚠️  Failed to set %s %s: %s", label.lower(), key, result)
+        else:
+            logger.info("✅ %s set: %s", label, key)
+
+def select_created_project(result, name: str) -> dict:
+    """
+    Pick the newly created project out of a create-project response.
+
+    Coolify sometimes returns a list of all projects instead of just the
+    created one. In that case, take the most recent project with a matching
+    name, scanning from the newest end and stopping at the first match.
+    If none match, assume the last project in the list is the new one.
+    """
+    if not isinstance(result, list):
+        return result
+    return next((p for p in reversed(result) if p.get("name") == name), result[-1])
 
 def validate_github_url(url: str) -> str:
     """Validate and format GitHub URL"""
-    if not url.startswith("https://github.com/") and not url.startswith("http://github.com/"):
+    m = _GITHUB_URL_RE.fullmatch(url)
+    if not m:
         raise HTTPException(status_code=400, detail="URL must be a GitHub repository")
-    if not url.endswith(".git"):
-        url = f"{url}.git"
-    return url
+    return url if m.group(1) else url + ".git"
 
-def generate_system_env_vars(domain: str) -> Dict[str, str]:
+@lru_cache(maxsize=1024)
+def generate_system_env_vars(domain: str) -> Mapping[str, str]:
     """
     Generate system-level environment variables based on user's domain.
 
@@ -179,7 +386,8 @@ def generate_system_env_vars(domain: str) -> Dict[str, str]:
         domain: User's chosen subdomain (e.g., 'myapp' for myapp.aedify.ai)
 
     Returns:
-        Dict of system environment variables to inject
+        Read-only mapping of system environment variables to inject. The
+        result is cached per domain and shared between callers.
     """
     # Ensure domain doesn't already include .aedify.ai
     if domain.endswith(".aedify.ai"):
@@ -187,10 +395,10 @@ def generate_system_env_vars(domain: str) -> Dict[str, str]:
     else:
         fqdn = f"{domain}.aedify.ai"
 
-    return {
+    return MappingProxyType({
         "COOLIFY_FQDN": fqdn,
         "URL": f"https://{fqdn}"
-    }
+    })
 
 def validate_subdomain(subdomain: str) -> str:
     """
@@ -211,21 +419,15 @@ def validate_subdomain(subdomain: str) -> str:
     Raises:
         HTTPException: If subdomain is invalid
     """
-    import re
-
-    # Strip whitespace and convert to lowercase
-    subdomain = subdomain.strip().lower()
-
-    # Remove .aedify.ai if user included it
-    if subdomain.endswith(".aedify.ai"):
-        subdomain = subdomain.replace(".aedify.ai", "")
+    # Strip whitespace, convert to lowercase and remove .aedify.ai if user included it
+    subdomain = subdomain.strip().lower().removesuffix(".aedify.ai")
 
     # Check if empty after cleaning
     if not subdomain:
         raise HTTPException(status_code=400, detail="Subdomain cannot be empty")
 
     # Validate format: only letters, numbers, and hyphens
-    if not re.match(r'^[a-z0-9-]+$', subdomain):
+    if not subdomain.isascii() or subdomain.encode("ascii").translate(None, _SUBDOMAIN_CHARS):
         raise HTTPException(
             status_code=400,
             detail="Subdomain can only contain letters, numbers, and hyphens (no spaces or special characters)"
@@ -255,8 +457,6 @@ def validate_project_name(project_name: str) -> str:
     Raises:
         HTTPException: If project name is invalid
     """
-    import re
-
     # Strip whitespace
     project_name = project_name.strip()
 
@@ -265,7 +465,8 @@ def validate_project_name(project_name: str) -> str:
         raise HTTPException(status_code=400, detail="Project name cannot be empty")
 
     # Validate format: only letters and numbers
-    if not re.match(r'^[a-zA-Z0-9]+$', project_name):
+    # ASCII-only isalnum() is exactly [a-zA-Z0-9]
+    if not (project_name.isascii() and project_name.isalnum()):
         raise HTTPException(
             status_code=400,
             detail="Project name can only contain letters and numbers (no spaces or special characters)"
@@ -273,29 +474,72 @@ def validate_project_name(project_name: str) -> str:
 
     return project_name
 
+def initialize_db_pool():
+    """
+    Create the PostgreSQL connection pool.
+    Connections are opened once and reused across requests.
+
+    Raises:
+        RuntimeError: If DATABASE_URL is not set
+        psycopg2.Error: If the database can't be reached
+    """
+    global DB_POOL
+    if not DATABASE_URL:
+        raise RuntimeError("DATABASE_URL is not set")
+    DB_POOL = ThreadedConnectionPool(DB_POOL_MIN_CONN, DB_POOL_MAX_CONN, DATABASE_URL)
+    logger.info("✅ Database pool ready (%d-%d connections)", DB_POOL_MIN_CONN, DB_POOL_MAX_CONN)
+
+def get_db_pool() -> ThreadedConnectionPool:
+    """
+    Return the connection pool, creating it and the tables on first use.
+
+    If the pool or the tables can't be created the error propagates, the
+    pool is discarded and the next call tries again.
+    """
+    global DB_POOL
+    if not _db_ready.is_set():
+        with _db_init_lock:
+            if DB_POOL is None:
+                logger.info("📊 Initializing PostgreSQL port counter...")
+                initialize_db_pool()
+                try:
+                    initialize_port_counter()
+                    initialize_deployment_jobs()
+                except Exception:
+                    DB_POOL.closeall()
+                    DB_POOL = None
+                    raise
+                _db_ready.set()
+    return DB_POOL
+
 @contextmanager
 def get_db_connection():
     """
-    Context manager for database connections.
-    Handles connection pooling and cleanup.
+    Context manager for pooled database connections.
+    Commits on success, rolls back on error and returns the connection to the pool.
     """
-    conn = None
-    try:
-        conn = psycopg2.connect(DATABASE_URL)
-        yield conn
-        conn.commit()
-    except Exception as e:
-        if conn:
-            conn.rollback()
-        raise
-    finally:
-        if conn:
-            conn.close()
+    pool = get_db_pool()
+
+    with _db_pool_slots:
+        conn = pool.getconn()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            # Drop connections the server closed instead of reusing them
+            pool.putconn(conn, close=bool(conn.closed))
 
 def initialize_port_counter():
     """
     Initialize the port counter table in PostgreSQL if it doesn't exist.
     Creates a table with a single row containing the current port number.
+
+    Raises:
+        psycopg2.Error: If the table can't be created
     """
     try:
         with get_db_connection() as conn:
@@ -318,18 +562,45 @@ def initialize_port_counter():
                 """, (INITIAL_HOST_PORT,))
 
                 conn.commit()
-                print(f"✅ Port counter table initialized")
+                logger.info("✅ Port counter table initialized")
+    except Exception as e:
+        logger.warning("⚠️  Port counter initialization error: %s", e)
+        raise
+
+def initialize_deployment_jobs():
+    """
+    Initialize the deployment_jobs table in PostgreSQL if it doesn't exist.
+    Each row tracks one background /api/deploy run.
+
+    Raises:
+        psycopg2.Error: If the table can't be created
+    """
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS deployment_jobs (
+                        job_id TEXT PRIMARY KEY,
+                        status TEXT NOT NULL,
+                        result JSONB,
+                        error JSONB,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+
+                conn.commit()
+                logger.info("✅ Deployment jobs table initialized")
     except Exception as e:
-        print(f"⚠️  Port counter initialization error: {e}")
-        # If DATABASE_URL is not set, we'll handle it gracefully
-        pass
+        logger.warning("⚠️  Deployment jobs initialization error: %s", e)
+        raise
 
 def get_next_port() -> int:
     """
     Atomically get the next available host port and increment the counter.
 
-    Uses PostgreSQL transaction with row-level locking (SELECT FOR UPDATE)
-    to ensure thread-safety and prevent race conditions.
+    Uses a single UPDATE ... RETURNING statement, so the increment and read
+    happen in one round trip and the row lock is only held for that statement.
 
     Returns:
         int: The next available host port
@@ -337,12 +608,12 @@ def get_next_port() -> int:
     try:
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                # Lock the row and get current port
+                # Increment and return the pre-increment value atomically
                 cur.execute("""
-                    SELECT current_port
-                    FROM port_counter
+                    UPDATE port_counter
+                    SET current_port = current_port + 1, updated_at = CURRENT_TIMESTAMP
                     WHERE id = 1
-                    FOR UPDATE
+                    RETURNING current_port - 1
                 """)
 
                 result = cur.fetchone()
@@ -354,28 +625,19 @@ def get_next_port() -> int:
 
                 current_port = result[0]
 
-                # Increment for next use
-                next_port = current_port + 1
-
-                cur.execute("""
-                    UPDATE port_counter
-                    SET current_port = %s, updated_at = CURRENT_TIMESTAMP
-                    WHERE id = 1
-                """, (next_port,))
-
                 conn.commit()
-                print(f"🔢 Assigned port: {current_port} (next will be {next_port})")
+                logger.info("🔢 Assigned port: %d (next will be %d)", current_port, current_port + 1)
 
                 return current_port
 
     except psycopg2.Error as e:
-        print(f"❌ Database error in get_next_port: {e}")
+        logger.error("❌ Database error in get_next_port: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to allocate port: Database error"
         )
     except Exception as e:
-        print(f"❌ Error in get_next_port: {e}")
+        logger.error("❌ Error in get_next_port: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to allocate port: {str(e)}"
@@ -400,9 +662,9 @@ def store_deployment_mapping(subdomain: str, app_uuid: str):
                 """, (subdomain, app_uuid))
 
                 conn.commit()
-                print(f"📝 Stored deployment mapping: {subdomain} → {app_uuid}")
+                logger.info("📝 Stored deployment mapping: %s → %s", subdomain, app_uuid)
     except Exception as e:
-        print(f"⚠️  Warning: Failed to store deployment mapping: {e}")
+        logger.warning("⚠️  Failed to store deployment mapping: %s", e)
         # Don't raise - this is not critical for deployment
 
 def get_app_uuid_by_subdomain(subdomain: str) -> str:
@@ -441,121 +703,277 @@ def get_app_uuid_by_subdomain(subdomain: str) -> str:
             detail=f"Database error: {str(e)}"
         )
 
+def create_deployment_job(job_id: str):
+    """
+    Record a new pending deployment job.
+
+    Args:
+        job_id: The job ID returned to the client
+
+    Raises:
+        HTTPException: If the job can't be stored
+    """
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    INSERT INTO deployment_jobs (job_id, status)
+                    VALUES (%s, 'pending')
+                """, (job_id,))
+
+                conn.commit()
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database error: {str(e)}"
+        )
+
+def update_deployment_job(job_id: str, status: str, result: Optional[dict] = None, error: Any = None):
+    """
+    Update the status (and outcome) of a deployment job.
+
+    Args:
+        job_id: The job ID
+        status: New status ('running', 'succeeded' or 'failed')
+        result: Deployment details on success
+        error: Error detail on failure
+    """
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    UPDATE deployment_jobs
+                    SET status = %s, result = %s, error = %s, updated_at = CURRENT_TIMESTAMP
+                    WHERE job_id = %s
+                """, (status, Json(result) if result is not None else None,
+                      Json(error) if error is not None else None, job_id))
+
+                conn.commit()
+    except Exception as e:
+        logger.warning("⚠️  Failed to update deployment job %s: %s", job_id, e)
+        # Don't raise - the deployment itself has already run
+
+def get_deployment_job(job_id: str) -> dict:
+    """
+    Get a deployment job by ID.
+
+    Args:
+        job_id: The job ID
+
+    Returns:
+        dict: The job's job_id, status, result and error
+
+    Raises:
+        HTTPException: If job not found
+    """
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute("""
+                    SELECT job_id, status, result, error FROM deployment_jobs WHERE job_id = %s
+                """, (job_id,))
+
+                result = cur.fetchone()
+                if not result:
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"No deployment job found: {job_id}"
+                    )
+
+                return dict(result)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database error: {str(e)}"
+        )
+
+# === DEPLOYMENT PIPELINE ===
+
+async def run_deployment_pipeline(request: FullDeploymentRequest, project_name: str, subdomain: str, git_repo: str) -> dict:
+    """
+    Run the Coolify side of a full deployment: creates project, app, sets env vars, and deploys.
+
+    Args:
+        request: The original deployment request
+        project_name: Validated project name
+        subdomain: Validated subdomain
+        git_repo: Validated GitHub URL
+
+    Returns:
+        dict: FullDeploymentResponse fields
+    """
+    # Generate app name from repo if not provided
+    app_name = git_repo.split('/')[-1].replace('.git', '')
+
+    # Get next available port (auto-increment)
+    host_port = await run_in_threadpool(get_next_port)
+
+    # Step 1: Create project
+    project = await coolify.create_project(project_name, f"Auto-created for {app_name}")
+
+    project = select_created_project(project, project_name)
+
+    project_uuid = project["uuid"]
+
+    # Step 2: Get environment (from the create response when Coolify includes it)
+    env = await get_project_environment(project_uuid, project)
+    env_uuid = env["uuid"]
+    env_name = env["name"]
+
+    # Step 3: Create application
+    # base_directory is only sent if provided
+    app_payload = CoolifyApplicationPayload.model_construct(
+        project_uuid=project_uuid,
+        environment_name=env_name,
+        git_repository=git_repo,
+        git_branch=request.git_branch,
+        name=app_name,
+        ports_exposes=CONTAINER_PORT_STR,
+        ports_mappings=f"{host_port}:{CONTAINER_PORT_STR}",
+        base_directory=request.base_directory or None
+    ).model_dump(exclude_none=True)
+
+    app = await coolify.create_application(app_payload)
+    app_uuid = app["uuid"]
+
+    # Store subdomain → app_uuid mapping immediately for log tracking
+    await run_in_threadpool(store_deployment_mapping, subdomain, app_uuid)
+
+    # Wait for app to be provisioned
+    await wait_for_app(app_uuid)
+
+    # Step 4: Set environment variables
+    # User-provided env vars and system-level env vars (COOLIFY_FQDN and
+    # URL) are sent together; system vars win if a user sets the same key
+    system_env_vars = generate_system_env_vars(subdomain)
+    await set_env_vars(app_uuid, {**(request.env_vars or {}), **system_env_vars})
+
+    # Step 5: Trigger deployment
+    await coolify.trigger_deploy(app_uuid)
+
+    # A freshly triggered deployment is queued; clients poll
+    # /api/applications/{app_uuid}/status for progress
+    status = "queued"
+
+    return FullDeploymentResponse.model_construct(
+        project_uuid=project_uuid,
+        environment_uuid=env_uuid,
+        app_uuid=app_uuid,
+        app_name=app_name,
+        deployment_status=status,
+        coolify_url=f"{COOLIFY_URL}/applications/{app_uuid}",
+        fqdn=system_env_vars["COOLIFY_FQDN"],
+        url=system_env_vars["URL"],
+        message="Full deployment initiated successfully"
+    ).model_dump()
+
+async def run_deployment_job(job_id: str, request: FullDeploymentRequest, project_name: str, subdomain: str, git_repo: str):
+    """Run the deployment pipeline for a job and record its outcome"""
+    await run_in_threadpool(update_deployment_job, job_id, "running")
+    try:
+        result = await run_deployment_pipeline(request, project_name, subdomain, git_repo)
+    except HTTPException as e:
+        logger.error("❌ Deployment job %s failed: %s", job_id, e.detail)
+        await run_in_threadpool(update_deployment_job, job_id, "failed", None, e.detail)
+    except Exception as e:
+        logger.error("❌ Deployment job %s failed: %s", job_id, e)
+        await run_in_threadpool(update_deployment_job, job_id, "failed", None, f"Deployment failed: {str(e)}")
+    else:
+        logger.info("✅ Deployment job %s succeeded: %s", job_id, result["app_uuid"])
+        await run_in_threadpool(update_deployment_job, job_id, "succeeded", result)
+
 # === ENDPOINTS ===
 
+# Static, so serialized once at import time
+ROOT_BYTES = orjson.dumps({
+    "message": "Coolify Deployment API",
+    "version": "1.0.0",
+    "endpoints": {
+        "create_project": "POST /api/projects",
+        "get_environment": "GET /api/projects/{uuid}/environment",
+        "get_all_applications": "GET /api/applications",
+        "create_application": "POST /api/applications",
+        "set_env_var": "POST /api/applications/{uuid}/envs",
+        "deploy": "POST /api/applications/{uuid}/deploy",
+        "deployment_status": "GET /api/applications/{uuid}/status",
+        "deployment_logs": "GET /api/logs/{subdomain}",
+        "full_deployment": "POST /api/deploy",
+        "deployment_job": "GET /api/deploy/{job_id}"
+    }
+})
+
 @app.get("/")
-def root():
+async def root():
     """Root endpoint"""
-    return {
-        "message": "Coolify Deployment API",
-        "version": "1.0.0",
-        "endpoints": {
-            "create_project": "POST /api/projects",
-            "get_environment": "GET /api/projects/{uuid}/environment",
-            "get_all_applications": "GET /api/applications",
-            "create_application": "POST /api/applications",
-            "set_env_var": "POST /api/applications/{uuid}/envs",
-            "deploy": "POST /api/applications/{uuid}/deploy",
-            "deployment_status": "GET /api/applications/{uuid}/status",
-            "deployment_logs": "GET /api/logs/{subdomain}",
-            "full_deployment": "POST /api/deploy"
-        }
-    }
+    return Response(content=ROOT_BYTES, media_type="application/json")
 
-@app.post("/api/projects", response_model=ProjectCreateResponse)
-def create_project(request: ProjectCreateRequest):
+@app.post("/api/projects", responses={200: {"model": ProjectCreateResponse}})
+async def create_project(request: ProjectCreateRequest):
     """Step 1: Create a new project"""
-    payload = {
-        "name": request.name,
-        "description": request.description or f"Auto-created project: {request.name}"
-    }
-    result = coolify_post("/api/v1/projects", payload)
-
-    # Handle Coolify API returning a list of all projects instead of just the created one
-    if isinstance(result, list):
-        # Find the project by name (most recently created with this name)
-        matching_projects = [p for p in result if p.get("name") == request.name]
-        if matching_projects:
-            # Get the last one (most recent)
-            result = matching_projects[-1]
-        else:
-            # Fallback: assume the last project in the list is the newly created one
-            result = result[-1]
+    result = await coolify.create_project(
+        request.name,
+        request.description or f"Auto-created project: {request.name}"
+    )
 
-    return ProjectCreateResponse(
+    result = select_created_project(result, request.name)
+
+    return ORJSONResponse(ProjectCreateResponse.model_construct(
         uuid=result["uuid"],
         name=result.get("name", request.name)
-    )
+    ).model_dump())
 
 @app.get("/api/projects/{project_uuid}/environment")
-def get_environment(project_uuid: str):
+async def get_environment(project_uuid: str):
     """Step 2: Get environment UUID for a project"""
-    proj_info = coolify_get(f"/api/v1/projects/{project_uuid}")
-    if not proj_info.get("environments") or len(proj_info["environments"]) == 0:
-        raise HTTPException(status_code=404, detail="No environments found for project")
-
-    env = proj_info["environments"][0]
-    return {
+    env = await get_project_environment(project_uuid)
+    return ORJSONResponse({
         "environment_uuid": env["uuid"],
         "environment_name": env["name"],
         "project_uuid": project_uuid
-    }
+    })
 
 @app.get("/api/applications")
-def get_all_applications():
+async def get_all_applications():
     """Get all applications from Coolify"""
-    return coolify_get("/api/v1/applications")
+    return ORJSONResponse(await coolify.list_applications())
 
-@app.post("/api/applications", response_model=ApplicationCreateResponse)
-def create_application(request: ApplicationCreateRequest):
+@app.post("/api/applications", responses={200: {"model": ApplicationCreateResponse}})
+async def create_application(request: ApplicationCreateRequest):
     """Step 3: Create a new application"""
     # Validate GitHub URL
     git_repo = validate_github_url(request.git_repository)
 
-    payload = {
-        "project_uuid": request.project_uuid,
-        "server_uuid": DEPLOY_SERVER_UUID,
-        "environment_name": request.environment_name,
-        "destination_uuid": DEPLOY_SERVER_UUID,
-        "git_repository": git_repo,
-        "git_branch": request.git_branch,
-        "build_pack": request.build_pack,
-        "name": request.name,
-        "ports_exposes": str(request.container_port),
-        "ports_mappings": f"{request.host_port}:{request.container_port}",
-        "docker_registry_image_name": DOCKERHUB_IMAGE,
-        "instant_deploy": False
-    }
-
-    result = coolify_post("/api/v1/applications/public", payload)
+    payload = CoolifyApplicationPayload.model_construct(
+        project_uuid=request.project_uuid,
+        environment_name=request.environment_name,
+        git_repository=git_repo,
+        git_branch=request.git_branch,
+        build_pack=request.build_pack,
+        name=request.name,
+        ports_exposes=str(request.container_port),
+        ports_mappings=f"{request.host_port}:{request.container_port}"
+    ).model_dump(exclude_none=True)
+
+    result = await coolify.create_application(payload)
     app_uuid = result["uuid"]
 
     # Wait for app to be provisioned
-    time.sleep(3)
+    await wait_for_app(app_uuid)
 
     # If domain is provided, inject system env vars
     if request.domain:
         system_env_vars = generate_system_env_vars(request.domain)
-        for key, value in system_env_vars.items():
-            env_payload = {
-                "key": key,
-                "value": value,
-                "is_preview": False,
-                "is_literal": True
-            }
-            try:
-                coolify_post(f"/api/v1/applications/{app_uuid}/envs", env_payload)
-                print(f"✅ System env var set: {key} = {value}")
-            except Exception as e:
-                print(f"⚠️  Warning: Failed to set system env var {key}: {str(e)}")
-
-    return ApplicationCreateResponse(
+        await set_env_vars(app_uuid, system_env_vars, "System env var")
+
+    return ORJSONResponse(ApplicationCreateResponse.model_construct(
         uuid=app_uuid,
         name=result.get("name", request.name)
-    )
+    ).model_dump())
 
-@app.post("/api/applications/{app_uuid}/envs", response_model=EnvVarResponse)
-def set_environment_variable(app_uuid: str, request: EnvVarRequest):
+@app.post("/api/applications/{app_uuid}/envs", responses={200: {"model": EnvVarResponse}})
+async def set_environment_variable(app_uuid: str, request: EnvVarRequest):
     """Step 4: Set an environment variable for an application"""
     payload = {
         "key": request.key,
@@ -564,73 +982,61 @@ def set_environment_variable(app_uuid: str, request: EnvVarRequest):
         "is_literal": request.is_literal
     }
 
-    result = coolify_post(f"/api/v1/applications/{app_uuid}/envs", payload)
-    return EnvVarResponse(
+    result = await coolify.set_env(app_uuid, payload)
+    return ORJSONResponse(EnvVarResponse.model_construct(
         uuid=result.get("uuid"),
         message=f"Environment variable '{request.key}' set successfully"
-    )
+    ).model_dump())
 
-@app.post("/api/applications/{app_uuid}/deploy", response_model=DeployResponse)
-def trigger_deployment(app_uuid: str):
+@app.post("/api/applications/{app_uuid}/deploy", responses={200: {"model": DeployResponse}})
+async def trigger_deployment(app_uuid: str):
     """Step 5: Trigger manual deployment"""
-    payload = {"uuid": app_uuid}
-    coolify_post("/api/v1/deploy", payload)
-    return DeployResponse(
+    await coolify.trigger_deploy(app_uuid)
+    return ORJSONResponse(DeployResponse.model_construct(
         uuid=app_uuid,
         message="Deployment triggered successfully"
-    )
+    ).model_dump())
 
-@app.get("/api/applications/{app_uuid}/status", response_model=DeploymentStatusResponse)
-def get_deployment_status(app_uuid: str):
+@app.get("/api/applications/{app_uuid}/status", responses={200: {"model": DeploymentStatusResponse}})
+async def get_deployment_status(app_uuid: str):
     """Step 6: Get deployment status"""
-    try:
-        deployments = coolify_get(f"/api/v1/applications/{app_uuid}/deployments")
-
-        if not deployments or len(deployments) == 0:
-            return DeploymentStatusResponse(
-                status="no_deployments",
-                message="No deployments found for this application"
-            )
-
-        latest = deployments[0]
-        status = latest.get("status", "unknown")
-
-        status_messages = {
-            "finished": "Deployment completed successfully",
-            "failed": "Deployment failed",
-            "in_progress": "Deployment in progress",
-            "queued": "Deployment queued"
-        }
-
-        return DeploymentStatusResponse(
-            status=status,
-            message=status_messages.get(status, f"Deployment status: {status}")
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get deployment status: {str(e)}")
+    latest = await coolify.get_latest_deployment(app_uuid)
+
+    if latest is None:
+        return ORJSONResponse(DeploymentStatusResponse.model_construct(
+            status="no_deployments",
+            message="No deployments found for this application"
+        ).model_dump())
+
+    status = latest.get("status", "unknown")
+
+    return ORJSONResponse(DeploymentStatusResponse.model_construct(
+        status=status,
+        message=DEPLOYMENT_STATUS_MESSAGES.get(status, f"Deployment status: {status}")
+    ).model_dump())
 
 @app.get("/api/logs/{subdomain}")
-def get_deployment_logs(subdomain: str):
+async def get_deployment_logs(subdomain: str):
     """Get deployment logs by subdomain (frontend-friendly endpoint)"""
     try:
         # Look up app_uuid from subdomain
-        app_uuid = get_app_uuid_by_subdomain(subdomain)
+        app_uuid = await run_in_threadpool(get_app_uuid_by_subdomain, subdomain)
 
         # Fetch logs from Coolify
-        logs = coolify_get(f"/api/v1/applications/{app_uuid}/logs")
+        logs = await coolify.get_application_logs(app_uuid)
 
-        return {
+        return ORJSONResponse({
             "subdomain": subdomain,
             "app_uuid": app_uuid,
             "logs": logs
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch logs: {str(e)}")
 
-@app.post("/api/deploy", response_model=FullDeploymentResponse)
-def full_deployment(request: FullDeploymentRequest):
+@app.post("/api/deploy", status_code=202, responses={202: {"model": DeploymentJobResponse}})
+async def full_deployment(request: FullDeploymentRequest, background_tasks: BackgroundTasks):
     """
     Complete deployment flow: Creates project, app, sets env vars, and deploys
 
@@ -640,159 +1046,69 @@ def full_deployment(request: FullDeploymentRequest):
     - GitHub repo URL
     - Base directory and branch (if needed)
     - ENV variables (optional key-value pairs)
+
+    Inputs are validated immediately; the Coolify calls run in the background.
+    Returns 202 with a job_id to poll at GET /api/deploy/{job_id}.
     """
-    try:
-        # Validate and sanitize inputs
-        project_name = validate_project_name(request.project_name)
-        subdomain = validate_subdomain(request.subdomain)
-        git_repo = validate_github_url(request.git_repository)
-
-        # Generate app name from repo if not provided
-        app_name = git_repo.split('/')[-1].replace('.git', '')
-
-        # Get next available port (auto-increment)
-        host_port = get_next_port()
-
-        # Step 1: Create project
-        project_payload = {
-            "name": project_name,
-            "description": f"Auto-created for {app_name}"
-        }
-        project = coolify_post("/api/v1/projects", project_payload)
-
-        # Handle Coolify API returning a list of all projects instead of just the created one
-        if isinstance(project, list):
-            # Find the project by name (most recently created with this name)
-            matching_projects = [p for p in project if p.get("name") == project_name]
-            if matching_projects:
-                # Get the last one (most recent)
-                project = matching_projects[-1]
-            else:
-                # Fallback: assume the last project in the list is the newly created one
-                project = project[-1]
-
-        project_uuid = project["uuid"]
-
-        # Step 2: Get environment
-        proj_info = coolify_get(f"/api/v1/projects/{project_uuid}")
-        env = proj_info["environments"][0]
-        env_uuid = env["uuid"]
-        env_name = env["name"]
-
-        # Step 3: Create application
-        app_payload = {
-            "project_uuid": project_uuid,
-            "server_uuid": DEPLOY_SERVER_UUID,
-            "environment_name": env_name,
-            "destination_uuid": DEPLOY_SERVER_UUID,
-            "git_repository": git_repo,
-            "git_branch": request.git_branch,
-            "build_pack": "nixpacks",
-            "name": app_name,
-            "ports_exposes": str(CONTAINER_PORT),
-            "ports_mappings": f"{host_port}:{CONTAINER_PORT}",
-            "docker_registry_image_name": DOCKERHUB_IMAGE,
-            "instant_deploy": False
-        }
-
-        # Add base_directory if provided
-        if request.base_directory:
-            app_payload["base_directory"] = request.base_directory
-
-        app = coolify_post("/api/v1/applications/public", app_payload)
-        app_uuid = app["uuid"]
-
-        # Store subdomain → app_uuid mapping immediately for log tracking
-        store_deployment_mapping(subdomain, app_uuid)
-
-        # Wait for app to be provisioned
-        time.sleep(3)
-
-        # Step 4: Set environment variables
-        # First, inject system-level env vars (COOLIFY_FQDN and URL)
-        system_env_vars = generate_system_env_vars(subdomain)
-
-        for key, value in system_env_vars.items():
-            env_payload = {
-                "key": key,
-                "value": value,
-                "is_preview": False,
-                "is_literal": True
-            }
-            try:
-                coolify_post(f"/api/v1/applications/{app_uuid}/envs", env_payload)
-                print(f"✅ System env var set: {key} = {value}")
-            except Exception as e:
-                print(f"⚠️  Warning: Failed to set system env var {key}: {str(e)}")
-
-        # Then, inject user-provided env vars
-        if request.env_vars:
-            for key, value in request.env_vars.items():
-                env_payload = {
-                    "key": key,
-                    "value": value,
-                    "is_preview": False,
-                    "is_literal": True
-                }
-                try:
-                    coolify_post(f"/api/v1/applications/{app_uuid}/envs", env_payload)
-                    print(f"✅ User env var set: {key}")
-                except Exception as e:
-                    # Log but continue if env var fails
-                    print(f"⚠️  Warning: Failed to set user env var {key}: {str(e)}")
-
-        # Step 5: Trigger deployment
-        deploy_payload = {"uuid": app_uuid}
-        coolify_post("/api/v1/deploy", deploy_payload)
-
-        # Step 6: Check initial deployment status
-        time.sleep(2)
-        try:
-            deployments = coolify_get(f"/api/v1/applications/{app_uuid}/deployments")
-            status = deployments[0].get("status", "unknown") if deployments else "queued"
-        except:
-            status = "unknown"
-
-        # Get the generated system env vars for response
-        system_env_vars = generate_system_env_vars(subdomain)
-
-        return FullDeploymentResponse(
-            project_uuid=project_uuid,
-            environment_uuid=env_uuid,
-            app_uuid=app_uuid,
-            app_name=app_name,
-            deployment_status=status,
-            coolify_url=f"{COOLIFY_URL}/applications/{app_uuid}",
-            fqdn=system_env_vars["COOLIFY_FQDN"],
-            url=system_env_vars["URL"],
-            message="Full deployment initiated successfully"
-        )
+    # Validate and sanitize inputs
+    project_name = validate_project_name(request.project_name)
+    subdomain = validate_subdomain(request.subdomain)
+    git_repo = validate_github_url(request.git_repository)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Deployment failed: {str(e)}")
+    job_id = uuid4().hex
+    await run_in_threadpool(create_deployment_job, job_id)
+    background_tasks.add_task(run_deployment_job, job_id, request, project_name, subdomain, git_repo)
+
+    system_env_vars = generate_system_env_vars(subdomain)
+    return ORJSONResponse(DeploymentJobResponse.model_construct(
+        job_id=job_id,
+        status="pending",
+        fqdn=system_env_vars["COOLIFY_FQDN"],
+        url=system_env_vars["URL"],
+        message="Deployment accepted"
+    ).model_dump(), status_code=202)
+
+@app.get("/api/deploy/{job_id}", responses={200: {"model": DeploymentJobStatusResponse}})
+async def get_deployment_job_status(job_id: str):
+    """Get the status and outcome of a full deployment job"""
+    job = await run_in_threadpool(get_deployment_job, job_id)
+    return ORJSONResponse(job)
 
 # === HEALTH CHECK ===
 
-@app.get("/health")
-def health_check():
-    """Health check endpoint"""
-    config_status = {
-        "coolify_url": bool(COOLIFY_URL),
-        "api_token": bool(API_TOKEN),
-        "deploy_server_uuid": bool(DEPLOY_SERVER_UUID),
-        "dockerhub_image": bool(DOCKERHUB_IMAGE)
-    }
+# Config is read once from the environment at import, so the health
+# report can't change while the process is running
+_config_status = {
+    "coolify_url": bool(COOLIFY_URL),
+    "api_token": bool(API_TOKEN),
+    "deploy_server_uuid": bool(DEPLOY_SERVER_UUID),
+    "dockerhub_image": bool(DOCKERHUB_IMAGE)
+}
 
-    all_configured = all(config_status.values())
+HEALTH_BYTES = orjson.dumps({
+    "status": "healthy" if all(_config_status.values()) else "misconfigured",
+    "config": _config_status
+})
 
-    return {
-        "status": "healthy" if all_configured else "misconfigured",
-        "config": config_status
-    }
+@app.get("/health")
+async def health_check():
+    """Health check endpoint"""
+    return Response(content=HEALTH_BYTES, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))  # Railway provides PORT env variable
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # The app is I/O-bound, and every worker opens its own DB pool, so cap
+    # the default rather than scaling with core count
+    workers = int(os.getenv("WEB_CONCURRENCY", min(os.cpu_count() or 1, 4)))
+    # Multiple workers require passing the app as an import string
+    uvicorn.run(
+        "api:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        log_level="info",
+        access_log=False
+    )
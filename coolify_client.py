@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Async client for the Coolify REST API.
+
+Holds the one pooled httpx connection to Coolify that every endpoint and
+the deployment pipeline share, so connection reuse, orjson encoding and
+error mapping live in a single place.
+"""
+from fastapi import HTTPException
+from typing import Any, Dict, List, Optional
+import asyncio
+import httpx
+import orjson
+
+# Only the latest deployment is ever read, so ask Coolify for a single
+# record. Servers that ignore the param still return the newest first.
+LATEST_DEPLOYMENT_QUERY = "?skip=0&take=1"
+
+# Coolify (and the proxy in front of it) answers with these while busy or
+# provisioning. Only requests that are safe to repeat are retried on them:
+# a POST that timed out at the proxy may still have created the resource,
+# so POSTs are retried on 429 (rejected outright) only.
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "PATCH"})
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5  # seconds, doubled after each attempt
+
+
+def coolify_error(r: httpx.Response) -> HTTPException:
+    """Build the HTTPException for an error response from Coolify"""
+    detail = r.text
+    if r.headers.get("content-type", "").startswith("application/json"):
+        # Proxies sometimes label empty or HTML error pages as JSON
+        try:
+            detail = orjson.loads(r.content)
+        except orjson.JSONDecodeError:
+            pass
+    return HTTPException(
+        status_code=r.status_code,
+        detail={"status_code": r.status_code, "detail": detail}
+    )
+
+
+class CoolifyClient:
+    """
+    Thin async wrapper around Coolify's /api/v1 endpoints.
+
+    The underlying httpx.AsyncClient is created by open() and released by
+    aclose(), which the app calls from its startup and shutdown events.
+    Errors from Coolify are raised as HTTPException with Coolify's status
+    code, and transport failures as HTTPException(500).
+    """
+
+    def __init__(self, base_url: Optional[str], api_token: Optional[str]):
+        self.base_url = base_url
+        self.headers = {
+            "Authorization": f"Bearer {api_token}",
+            "Accept": "application/json",
+            "Content-Type": "application/json"
+        }
+        self._http: Optional[httpx.AsyncClient] = None
+
+    def open(self):
+        """Create the pooled HTTP client (must run inside the app's event loop)"""
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url or "",
+            headers=self.headers,
+            # Fail fast if Coolify is unreachable; allow slow responses once connected
+            timeout=httpx.Timeout(30.0, connect=3.05),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32),
+                retries=3
+            )
+        )
+
+    async def aclose(self):
+        """Close pooled connections"""
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+
+    # --- Raw requests ---
+
+    async def request(self, method: str, endpoint: str, payload: Optional[dict] = None):
+        """
+        Make a request to the Coolify API and return the decoded JSON body.
+
+        Transient errors (see RETRY_STATUSES) are retried with exponential
+        backoff, up to MAX_RETRIES times, when the method is safe to repeat.
+        """
+        try:
+            # Content-Type: application/json is already set on the client
+            content = orjson.dumps(payload) if payload is not None else None
+            delay = RETRY_BACKOFF
+            for attempt in range(MAX_RETRIES + 1):
+                r = await self._http.request(method, endpoint, content=content)
+                if not r.is_error:
+                    return orjson.loads(r.content)
+                if attempt == MAX_RETRIES or not self._should_retry(method, r.status_code):
+                    break
+                await asyncio.sleep(delay)
+                delay *= 2
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        raise coolify_error(r)
+
+    @staticmethod
+    def _should_retry(method: str, status_code: int) -> bool:
+        """Whether a failed request can be sent again without side effects"""
+        if status_code not in RETRY_STATUSES:
+            return False
+        return method in IDEMPOTENT_METHODS or status_code == 429
+
+    async def get(self, endpoint: str):
+        """Make GET request to Coolify API"""
+        return await self.request("GET", endpoint)
+
+    async def post(self, endpoint: str, payload: dict):
+        """Make POST request to Coolify API"""
+        return await self.request("POST", endpoint, payload)
+
+    async def patch(self, endpoint: str, payload: dict):
+        """Make PATCH request to Coolify API"""
+        return await self.request("PATCH", endpoint, payload)
+
+    # --- Projects ---
+
+    async def create_project(self, name: str, description: str = ""):
+        """Create a project; Coolify may answer with the new project or the full list"""
+        return await self.post("/api/v1/projects", {"name": name, "description": description})
+
+    async def get_project(self, project_uuid: str) -> Dict[str, Any]:
+        """Get a project, including its environments"""
+        return await self.get(f"/api/v1/projects/{project_uuid}")
+
+    # --- Applications ---
+
+    async def list_applications(self) -> List[Dict[str, Any]]:
+        """Get all applications"""
+        return await self.get("/api/v1/applications")
+
+    async def get_application(self, app_uuid: str) -> Dict[str, Any]:
+        """Get a single application"""
+        return await self.get(f"/api/v1/applications/{app_uuid}")
+
+    async def create_application(self, payload: dict) -> Dict[str, Any]:
+        """Create an application from a public Git repository"""
+        return await self.post("/api/v1/applications/public", payload)
+
+    async def get_application_logs(self, app_uuid: str):
+        """Get an application's container logs"""
+        return await self.get(f"/api/v1/applications/{app_uuid}/logs")
+
+    # --- Environment variables ---
+
+    async def set_env(self, app_uuid: str, env: dict) -> Dict[str, Any]:
+        """Create one environment variable on an application"""
+        return await self.post(f"/api/v1/applications/{app_uuid}/envs", env)
+
+    async def set_envs_bulk(self, app_uuid: str, envs: List[dict]):
+        """Create or update several environment variables in one request"""
+        return await self.patch(f"/api/v1/applications/{app_uuid}/envs/bulk", {"data": envs})
+
+    # --- Deployments ---
+
+    async def trigger_deploy(self, app_uuid: str):
+        """Queue a deployment of an application"""
+        return await self.post("/api/v1/deploy", {"uuid": app_uuid})
+
+    async def get_latest_deployment(self, app_uuid: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an application's most recent deployment, or None if it has none.
+
+        Raises:
+            HTTPException: 502 if Coolify answers with something other than
+                a deployments list
+        """
+        deployments = await self.get(
+            f"/api/v1/applications/{app_uuid}/deployments{LATEST_DEPLOYMENT_QUERY}"
+        )
+        # Some Coolify versions wrap the list as {"deployments": [...]}
+        if isinstance(deployments, dict) and "deployments" in deployments:
+            deployments = deployments["deployments"]
+        if not isinstance(deployments, list):
+            raise HTTPException(
+                status_code=502,
+                detail={"status_code": 502, "detail": "Unexpected deployments response from Coolify"}
+            )
+        return deployments[0] if deployments else None
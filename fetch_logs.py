@@ -3,13 +3,28 @@
 Fetch deployment logs by subdomain
 """
 import requests
-import json
+import orjson
 import sys
 import argparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Deployed API server URL
 API_BASE_URL = "http://10.131.1.76:8000"
 
+# Reused across calls (keep-alive) with a short connect timeout, and retried
+# when the API is briefly unavailable behind its proxy
+REQUEST_TIMEOUT = (3.05, 30)
+_adapter = HTTPAdapter(max_retries=Retry(
+    total=2,
+    backoff_factor=0.3,
+    status_forcelist=[502, 503, 504],
+    raise_on_status=False  # hand the last response to raise_for_status
+))
+_session = requests.Session()
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
 def fetch_logs(subdomain):
     """Fetch logs for a given subdomain"""
     try:
@@ -18,10 +33,10 @@ def fetch_logs(subdomain):
         print(f"URL: {url}")
         print()
 
-        response = requests.get(url)
+        response = _session.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
 
-        result = response.json()
+        result = orjson.loads(response.content)
 
         print("=" * 80)
         print(f"DEPLOYMENT LOGS FOR: {subdomain}.aedify.ai")
@@ -33,7 +48,10 @@ def fetch_logs(subdomain):
 
         logs = result.get('logs', {})
         if logs:
-            print(json.dumps(logs, indent=2))
+            # Write the encoded bytes directly instead of building a str copy
+            sys.stdout.flush()
+            sys.stdout.buffer.write(orjson.dumps(logs, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+            sys.stdout.buffer.flush()
         else:
             print("No logs available yet.")
 
@@ -42,9 +60,9 @@ def fetch_logs(subdomain):
     except requests.HTTPError as e:
         print(f"❌ HTTP Error: {e.response.status_code}")
         try:
-            error_detail = e.response.json()
-            print(f"Details: {json.dumps(error_detail, indent=2)}")
-        except:
+            error_detail = orjson.loads(e.response.content)
+            print(f"Details: {orjson.dumps(error_detail, option=orjson.OPT_INDENT_2).decode()}")
+        except ValueError:
             print(f"Details: {e.response.text}")
         sys.exit(1)
     except Exception as e: